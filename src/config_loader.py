@@ -0,0 +1,13 @@
+import yaml
+from functools import lru_cache
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+@lru_cache(maxsize=4)
+def load_config(config_path='config/config.yaml'):
+    """Load configuration settings from a YAML file (cached per path, do not mutate)."""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=SafeLoader)
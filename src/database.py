@@ -1,20 +1,27 @@
-import yaml
+from functools import lru_cache
 from pymongo import MongoClient
+from config_loader import load_config
 
-def load_config(config_path='config/config.yaml'):
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+@lru_cache(maxsize=None)
+def get_client(uri):
+    """Return a shared MongoClient for the given URI so components reuse one connection pool."""
+    return MongoClient(uri, connect=False)
 
 class Database:
     def __init__(self):
         config = load_config()
-        self.client = MongoClient(config['mongodb']['uri'])
+        self.client = get_client(config['mongodb']['uri'])
         self.db = self.client[config['mongodb']['database']]
         self.collection = self.db[config['mongodb']['collection']]
 
     def insert_log(self, log):
         self.collection.insert_one(log)
 
+    def insert_logs(self, logs):
+        # One round trip for the whole batch; unordered so a bad document does not stop the rest
+        if logs:
+            self.collection.insert_many(logs, ordered=False)
+
     def fetch_logs(self, query={}):
         return list(self.collection.find(query))
 
@@ -25,6 +32,6 @@ if __name__ == "__main__":
         'emotions_detected': ['angry'],
         'response': "Mujhe afsos hai ke aap ko yeh pasand nahi aaya."
     }
-    db.insert_log(sample_log)
+    db.insert_logs([sample_log])
     logs = db.fetch_logs()
     print(logs)
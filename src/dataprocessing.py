@@ -1,12 +1,8 @@
 import pandas as pd
 import os
-import yaml
+import openpyxl
 from sklearn.model_selection import train_test_split
-
-def load_config(config_path='config/config.yaml'):
-    """Load configuration settings from a YAML file."""
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+from config_loader import load_config
 
 def preprocess_data():
     """Process the XLSM file and split it into training and test datasets."""
@@ -15,19 +11,28 @@ def preprocess_data():
     raw_data_path = config['data']['raw_data_path']
     processed_data_path = config['data']['processed_data_path']
 
-    # Load the dataset from the XLSM file
+    # Stream the annotation sheet row by row in read-only mode so only the
+    # two columns we need are ever materialised
     print("Loading dataset...")
-    df = pd.read_excel(raw_data_path, sheet_name="Annotation Dataset")
-    
-    # Keep only the relevant columns: Tweets and Level 2 (Emotion)
-    df = df[['Tweets', 'Level 2']]
-
-    # Rename columns for better understanding
-    df.columns = ['Tweet', 'Emotion']
-
-    # Filter rows with required emotions
-    valid_emotions = ['Anger', 'Happy', 'Neutral', 'Sad']
-    df = df[df['Emotion'].isin(valid_emotions)]
+    valid_emotions = {'Anger', 'Happy', 'Neutral', 'Sad'}
+    workbook = openpyxl.load_workbook(raw_data_path, read_only=True, data_only=True)
+    try:
+        rows = workbook["Annotation Dataset"].iter_rows(values_only=True)
+        header = next(rows)
+        tweet_idx = header.index("Tweets")
+        emotion_idx = header.index("Level 2")
+
+        # Keep only Tweets and Level 2 (Emotion) for the required emotions
+        tweets, emotions = [], []
+        for row in rows:
+            emotion = row[emotion_idx]
+            if emotion in valid_emotions:
+                tweets.append(row[tweet_idx])
+                emotions.append(emotion)
+    finally:
+        workbook.close()
+
+    df = pd.DataFrame({'Tweet': tweets, 'Emotion': emotions})
 
     # Split the data into training (80%) and test (10%) sets
     print("Splitting data...")
@@ -1,25 +1,37 @@
-import yaml
-from pymongo import MongoClient
+from functools import lru_cache
+from config_loader import load_config
+from database import get_client
 from transformers import pipeline
 
-def load_config(config_path='config/config.yaml'):
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+SUPPORTED_EMOTIONS = frozenset(['happy', 'sad', 'neutral', 'angry'])
+EMOTION_CACHE_SIZE = 1024
 
 class EmotionDetector:
     def __init__(self):
         config = load_config()
-        self.client = MongoClient(config['mongodb']['uri'])
-        self.db = self.client[config['mongodb']['database']]
-        self.collection = self.db[config['mongodb']['collection']]
+        # MongoDB is only needed for logging, so connect on first use
+        self.mongodb_config = config['mongodb']
+        self.client = None
+        self.db = None
+        self.collection = None
         # Initialize emotion detection pipeline
         self.emotion_classifier = pipeline('text-classification', model='nateraw/bert-base-uncased-emotion')
+        # Repeated messages in a chat session reuse the earlier classification
+        self._classify = lru_cache(maxsize=EMOTION_CACHE_SIZE)(self._classify_uncached)
 
-    def detect_emotion(self, text):
+    def _classify_uncached(self, text):
         emotions = self.emotion_classifier(text)
         # Filter emotions to keep only the required ones
-        filtered_emotions = [e for e in emotions if e['label'].lower() in ['happy', 'sad', 'neutral', 'angry']]
-        return filtered_emotions
+        return tuple(e for e in emotions if e['label'].lower() in SUPPORTED_EMOTIONS)
+
+    def detect_emotion(self, text):
+        # Hand out copies so callers cannot modify the cached results
+        return [dict(e) for e in self._classify(text)]
+
+    def _connect(self):
+        self.client = get_client(self.mongodb_config['uri'])
+        self.db = self.client[self.mongodb_config['database']]
+        self.collection = self.db[self.mongodb_config['collection']]
 
     def log_interaction(self, user_input, emotions, response):
         log = {
@@ -27,6 +39,8 @@ class EmotionDetector:
             'emotions_detected': emotions,
             'response': response
         }
+        if self.collection is None:
+            self._connect()
         self.collection.insert_one(log)
 
 if __name__ == "__main__":
@@ -1,55 +1,95 @@
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from config_loader import load_config
 from dataprocessing import preprocess_data
 from emotion_detection import EmotionDetector
-from responce_generation import ResponseGenerator
+from responce_generation import get_response_generator
 # from models.speach.speach_synthasis import SpeechSynthesizer
 from database import Database
 
-def load_config(config_path='config/config.yaml'):
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+def _report_log_errors(log_futures):
+    """Print failures of finished log writes and return the writes still in flight."""
+    in_flight = []
+    for future in log_futures:
+        if not future.done():
+            in_flight.append(future)
+            continue
+        error = future.exception()
+        if error is not None:
+            print(f"Failed to write interaction logs: {error}")
+    return in_flight
 
 def main():
     config = load_config()
     
-    # Preprocess data
-    preprocess_data()
-    
-    # Initialize components
-    detector = EmotionDetector()
-    generator = ResponseGenerator()
-    # synthesizer = SpeechSynthesizer()
-    db = Database()
+    # Preprocess data in the background while the models load
+    with ThreadPoolExecutor(max_workers=1) as startup:
+        preprocessing = startup.submit(preprocess_data)
+
+        # Initialize components
+        detector = EmotionDetector()
+        generator = get_response_generator()
+        # synthesizer = SpeechSynthesizer()
+        db = Database()
+
+        # Surface any preprocessing error before the chat loop starts
+        preprocessing.result()
     
-    while True:
-        user_input = input("Enter a Roman Urdu sentence (or type 'exit' to quit): ")
-        if user_input.lower() == 'exit':
-            break
-        
-        # Detect emotions
-        emotions = detector.detect_emotion(user_input)
-        emotion_labels = [e['label'] for e in emotions]
-        print(f"Detected Emotions: {', '.join(emotion_labels)}")
-        
-        # Generate response
-        response = generator.generate_response(user_input, emotions)
-        print(f"Bot Response: {response}")
-        
-        # Synthesize speech
-        # speech_file = synthesizer.synthesize_speech(response, "response")
-        # print(f"Speech synthesized at: {speech_file}")
-        
-        # Log interaction
-        log = {
-            'user_input': user_input,
-            'emotions_detected': emotion_labels,
-            'response': response
-            # ,'speech_file': speech_file
-        }
-        db.insert_log(log)
-        
-        # Reinforcement Learning could be integrated here based on user feedback
-        # For simplicity, it's omitted in this pipeline
+    # Interaction logs are buffered and written to MongoDB in batches
+    log_batch_size = config['mongodb'].get('log_batch_size', 1)
+    pending_logs = []
+    # A single background writer keeps MongoDB round trips off the reply path
+    log_writer = ThreadPoolExecutor(max_workers=1)
+    # Failures are reported from this thread so they never interrupt the input prompt
+    log_futures = []
+
+    try:
+        while True:
+            log_futures = _report_log_errors(log_futures)
+            user_input = input("Enter a Roman Urdu sentence (or type 'exit' to quit): ")
+            if user_input.lower() == 'exit':
+                break
+
+            # Detect emotions
+            emotions = detector.detect_emotion(user_input)
+            emotion_labels = [e['label'] for e in emotions]
+            print(f"Detected Emotions: {', '.join(emotion_labels)}")
+
+            # Generate response, printing tokens as they arrive when streaming is enabled
+            if generator.stream:
+                print("Bot Response: ", end="", flush=True)
+                chunks = []
+                for chunk in generator.generate_response_stream(user_input, emotions):
+                    print(chunk, end="", flush=True)
+                    chunks.append(chunk)
+                print()
+                response = "".join(chunks).strip()
+            else:
+                response = generator.generate_response(user_input, emotions)
+                print(f"Bot Response: {response}")
+
+            # Synthesize speech
+            # speech_file = synthesizer.synthesize_speech(response, "response")
+            # print(f"Speech synthesized at: {speech_file}")
+
+            # Log interaction
+            log = {
+                'user_input': user_input,
+                'emotions_detected': emotion_labels,
+                'response': response
+                # ,'speech_file': speech_file
+            }
+            pending_logs.append(log)
+            if len(pending_logs) >= log_batch_size:
+                log_futures.append(log_writer.submit(db.insert_logs, pending_logs))
+                pending_logs = []
+
+            # Reinforcement Learning could be integrated here based on user feedback
+            # For simplicity, it's omitted in this pipeline
+    finally:
+        # Flush whatever is left and wait for queued batches so no interaction is lost on exit
+        log_futures.append(log_writer.submit(db.insert_logs, pending_logs))
+        log_writer.shutdown(wait=True)
+        _report_log_errors(log_futures)
 
 if __name__ == "__main__":
     main()
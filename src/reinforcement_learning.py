@@ -1,48 +1,53 @@
-import yaml
-from stable_baselines3 import PPO
-from stable_baselines3.common.envs import DummyVecEnv
-import gym
-
-def load_config(config_path='config/config.yaml'):
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
-
-class EmotionEnv(gym.Env):
-    """Custom Environment for Emotion-based Chatbot"""
-    def __init__(self, config):
-        super(EmotionEnv, self).__init__()
-        self.action_space = gym.spaces.Discrete(4)  # Actions: happy, sad, neutral, angry
-        self.observation_space = gym.spaces.Box(low=0, high=1, shape=(10,), dtype=float)
-        self.config = config
-
-    def reset(self):
-        # Reset the state of the environment to an initial state
-        return self.observation_space.sample()
-
-    def step(self, action):
-        # Execute one step within the environment
-        reward = 0
-        done = False
-        info = {}
-        
-        # Define reward logic based on action
-        # For example, positive response to happy, etc.
-        if action == 0:  # happy
-            reward = 1
-        elif action == 1:  # sad
-            reward = -1
-        elif action == 2:  # neutral
-            reward = 0
-        elif action == 3:  # angry
-            reward = -2
-        
-        # Define when to end the episode
-        done = True
-        return self.observation_space.sample(), reward, done, info
+from functools import lru_cache
+from config_loader import load_config
+
+# gym and stable_baselines3 pull in Torch, so they are imported only when
+# an environment is built or a model is trained
+
+# Reward per action, indexed by action id: happy, sad, neutral, angry
+ACTION_REWARDS = (1, -1, 0, -2)
+
+@lru_cache(maxsize=None)
+def _emotion_env_class():
+    """Define EmotionEnv on first use so gym is not needed at import time."""
+    import gym
+
+    class EmotionEnv(gym.Env):
+        """Custom Environment for Emotion-based Chatbot"""
+        def __init__(self, config):
+            super(EmotionEnv, self).__init__()
+            self.action_space = gym.spaces.Discrete(4)  # Actions: happy, sad, neutral, angry
+            self.observation_space = gym.spaces.Box(low=0, high=1, shape=(10,), dtype=float)
+            self.config = config
+
+        def reset(self):
+            # Reset the state of the environment to an initial state
+            return self.observation_space.sample()
+
+        def step(self, action):
+            # Execute one step within the environment
+            done = False
+            info = {}
+            
+            # Reward logic based on action, e.g. positive response to happy
+            reward = ACTION_REWARDS[action]
+            
+            # Define when to end the episode
+            done = True
+            return self.observation_space.sample(), reward, done, info
+
+    return EmotionEnv
+
+def make_emotion_env(config):
+    """Create an EmotionEnv instance for the given configuration."""
+    return _emotion_env_class()(config)
 
 def train_rl_model():
+    from stable_baselines3 import PPO
+    from stable_baselines3.common.vec_env import DummyVecEnv
+
     config = load_config()
-    env = DummyVecEnv([lambda: EmotionEnv(config)])
+    env = DummyVecEnv([lambda: make_emotion_env(config)])
     model = PPO('MlpPolicy', env, verbose=1)
     model.learn(total_timesteps=10000)
     model.save("models/rl_model")
@@ -1,57 +1,180 @@
+import asyncio
 import requests
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 import json
+from config_loader import load_config
 
-def load_config(config_path='config/config.yaml'):
-    """Load configuration settings from a YAML file."""
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+class _EmptyResponse(Exception):
+    """Raised from the cached call so empty replies are never memoized."""
 
 class ResponseGenerator:
+    # Static prompt skeleton; only the user input and emotion labels vary per call
+    _PROMPT_TEMPLATE = (
+        "User said: '{user_input}'.\n"
+        "Detected emotions: {emotions}.\n"
+        "Generate a considerate and appropriate response in Roman_Urdu reflecting the detected emotions."
+    )
+
     def __init__(self):
         """Initialize the ResponseGenerator with the Ollama API endpoint and model."""
         config = load_config()
         self.model_name = config['llm']['model_name']
         self.api_endpoint = f"{config['ollama']['api_url']}/generate"
+        # Identical turns (same input and emotions) are answered from memory
+        self._generate_cached = lru_cache(maxsize=config['llm'].get('response_cache_size', 512))(self._generate_uncached)
+        # Token streaming is only worth its per-chunk overhead for callers that render live
+        self.stream = config['ollama'].get('stream', False)
+        # Keep the model resident between turns and cap generation server-side
+        self.keep_alive = config['ollama'].get('keep_alive')
+        # (connect, read) seconds shared by every request to Ollama
+        self.timeout = tuple(config['ollama'].get('timeout', (3, 600)))
+        self.options = config['llm'].get('options')
+        # Reuse one keep-alive connection pool for every call to Ollama; bodies are
+        # pre-serialized JSON bytes, so the content type is set once here
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.session.headers["Content-Type"] = "application/json"
 
-    def generate_response(self, user_input, emotions):
-        """Generate a response using the Ollama API based on user input and detected emotions."""
+    def close(self):
+        """Release the pooled HTTP connections."""
+        self.session.close()
+
+    def _create_response_generation_prompt(self, user_input, emotion_labels):
+        """Fill the prompt template with the user input and detected emotion labels."""
+        return self._PROMPT_TEMPLATE.format(user_input=user_input, emotions=', '.join(emotion_labels))
+
+    def _build_payload(self, user_input, emotion_labels):
+        """Build the Ollama request body for one user turn."""
         # Create a prompt based on detected emotions
-        emotion_labels = [e['label'] for e in emotions]
-        prompt = (
-            f"User said: '{user_input}'.\n"
-            f"Detected emotions: {', '.join(emotion_labels)}.\n"
-            f"Generate a considerate and appropriate response in Roman_Urdu reflecting the detected emotions."
-        )
+        prompt = self._create_response_generation_prompt(user_input, emotion_labels)
 
         # Payload for the Ollama API
         payload = {
             "model": self.model_name,
-            "prompt": prompt
+            "prompt": prompt,
+            "stream": self.stream
         }
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        if self.options:
+            payload["options"] = self.options
+        return payload
+
+    @staticmethod
+    def _normalize_input(user_input):
+        """Collapse whitespace so trivially different inputs share a cache entry and prompt."""
+        return " ".join(user_input.split())
+
+    def _generate_uncached(self, user_input, emotion_labels):
+        response_text = self._post_one(self._build_payload(user_input, emotion_labels))
+        if not response_text:
+            raise _EmptyResponse()
+        return response_text
+
+    def _generate(self, user_input, emotion_labels):
+        try:
+            return self._generate_cached(user_input, emotion_labels)
+        except _EmptyResponse:
+            return ""
+
+    def generate_response(self, user_input, emotions):
+        """Generate a response using the Ollama API based on user input and detected emotions."""
+        emotion_labels = tuple(e['label'] for e in emotions)
+        return self._generate(self._normalize_input(user_input), emotion_labels)
+
+    def generate_responses_batch(self, inputs, max_workers=8):
+        """Generate responses for several (user_input, emotions) pairs concurrently, preserving order."""
+        # Single pass over inputs so generators and other one-shot iterables work
+        user_inputs, label_sets = [], []
+        for user_input, emotions in inputs:
+            user_inputs.append(self._normalize_input(user_input))
+            label_sets.append(tuple(e['label'] for e in emotions))
+        # Requests are independent, so they overlap on the shared session's connection pool
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._generate, user_inputs, label_sets))
+
+    async def generate_response_async(self, user_input, emotions):
+        """Coroutine version of generate_response for asyncio callers."""
+        # The blocking request runs in the loop's executor over the shared session,
+        # so concurrent coroutines overlap their network waits
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate_response, user_input, emotions)
+
+    async def generate_responses_batch_async(self, inputs):
+        """Generate responses for several (user_input, emotions) pairs concurrently with asyncio.gather."""
+        return await asyncio.gather(*(self.generate_response_async(user_input, emotions) for user_input, emotions in inputs))
+
+    def _post_one(self, payload):
+        """Send one payload to the Ollama API and return the complete response text."""
+        if not self.stream:
+            # A single JSON object holds the whole reply
+            response = self.session.post(self.api_endpoint, data=_json_dumps(payload), timeout=self.timeout)
+            if response.status_code != 200:
+                raise Exception(f"Error in generating response: {response.text}")
+            return _json_loads(response.content).get("response", "").strip()
 
-        # Send request to the Ollama API
-        response = requests.post(self.api_endpoint, json=payload, stream=True)
-        
-        # Handle streamed response
-        complete_response = ""
-        for line in response.iter_lines(decode_unicode=True):
-            if line.strip():  # Skip empty lines
-                try:
-                    json_data = json.loads(line)
+        return "".join(self._stream(payload)).strip()
+
+    def generate_response_stream(self, user_input, emotions):
+        """Yield response text chunks from the Ollama API as they are generated."""
+        payload = self._build_payload(self._normalize_input(user_input), tuple(e['label'] for e in emotions))
+        payload["stream"] = True
+        yield from self._stream(payload)
+
+    def _stream(self, payload):
+        """Yield the "response" field of each NDJSON line streamed back by Ollama."""
+        # Closing the response hands the connection back to the session pool
+        with self.session.post(self.api_endpoint, data=_json_dumps(payload), stream=True, timeout=self.timeout) as response:
+            if response.status_code != 200:
+                raise Exception(f"Error in generating response: {response.text}")
+            # Lines stay as bytes, the JSON parser decodes them
+            for line in response.iter_lines(decode_unicode=False):
+                if line.strip():  # Skip empty lines
+                    try:
+                        json_data = _json_loads(line)
+                    except json.JSONDecodeError as e:
+                        raise Exception(f"Failed to parse JSON line: {line.decode('utf-8', 'replace')}\nError: {e}")
                     if "response" in json_data:
-                        complete_response += json_data["response"]
+                        yield json_data["response"]
                     if json_data.get("done", False):  # Stop if "done" is true
-                        break
-                except json.JSONDecodeError as e:
-                    raise Exception(f"Failed to parse JSON line: {line}\nError: {e}")
+                        return
 
-        return complete_response.strip()
+@lru_cache(maxsize=1)
+def get_response_generator():
+    """Return the process-wide ResponseGenerator, sharing its session and response cache."""
+    return ResponseGenerator()
 
 if __name__ == "__main__":
-    # Example usage
-    generator = ResponseGenerator()
-    sample_input = "Yeh fair game nai thi I don’t like it"
-    sample_emotions = [{'label': 'angry', 'score': 0.99}]
-    response = generator.generate_response(sample_input, sample_emotions)
-    print(f"Generated Response: {response}")
+    # Example usage: the sample turns are sent concurrently
+    async def _selftest(generator, samples, concurrency=4):
+        # Cap in-flight requests so a single Ollama server is not flooded
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(user_input, emotions):
+            async with semaphore:
+                return await generator.generate_response_async(user_input, emotions)
+
+        return await asyncio.gather(*(run(user_input, emotions) for user_input, emotions in samples))
+
+    generator = get_response_generator()
+    samples = [
+        ("Yeh fair game nai thi I don’t like it", [{'label': 'angry', 'score': 0.99}]),
+        ("Aaj ka din bohat acha tha", [{'label': 'happy', 'score': 0.97}]),
+        ("Mujhe aaj kuch acha nahi lag raha", [{'label': 'sad', 'score': 0.91}]),
+    ]
+    responses = asyncio.run(_selftest(generator, samples))
+    for (sample_input, _), response in zip(samples, responses):
+        print(f"Input: {sample_input}")
+        print(f"Generated Response: {response}")